@@ -7,10 +7,10 @@ Animation Tab - Contains UI and logic for:
 """
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
-from PyQt6.QtCore import Qt, QRectF
-from PyQt6.QtGui import QPixmap, QPen, QColor
+from PyQt6.QtCore import Qt, QRectF, QTimer
+from PyQt6.QtGui import QImage, QPixmap, QPen, QColor
 from PyQt6.QtWidgets import (
     QFormLayout,
     QGraphicsLineItem,
@@ -29,12 +29,32 @@ from PyQt6.QtWidgets import (
     QFileDialog,
 )
 
+import numpy as np
 from PIL import Image
 
+from compositing import composite_frames, premultiply, write_png_rows
+
+# Frames composited per kernel call when streaming a vertical spritesheet:
+# enough for the parallel kernel to spread across cores, while only that
+# many frames are held in memory at once
+_VERTICAL_BATCH_FRAMES = 16
+
 if TYPE_CHECKING:
     from gui import MainWindow
 
 
+def _load_rgba(path: Path) -> np.ndarray:
+    """Decode an image file into an RGBA array."""
+    with Image.open(path) as img:
+        return np.asarray(img.convert("RGBA"))
+
+
+def _pixmap_from_rgba(rgba: np.ndarray) -> QPixmap:
+    h, w = rgba.shape[:2]
+    image = QImage(rgba.data, w, h, 4 * w, QImage.Format.Format_RGBA8888)
+    return QPixmap.fromImage(image)
+
+
 class AnimView(QGraphicsView):
     """Custom QGraphicsView that reports click positions for snap points."""
 
@@ -66,6 +86,24 @@ class AnimationTab(QWidget):
         self.center_edge_y: float | None = None
         self.start_line_item: QGraphicsLineItem | None = None
         self.end_line_item: QGraphicsLineItem | None = None
+        # Decoded RGBA pixels, shared by the scene pixmaps and the export
+        self._guide_np: np.ndarray | None = None
+        self._cap_np: np.ndarray | None = None
+        self._cap_premul: np.ndarray | None = None
+
+        # Edge marker pens, shared by every line update
+        self._start_pen = QPen(QColor("#ff0000"))
+        self._start_pen.setWidth(2)
+        self._start_pen.setStyle(Qt.PenStyle.DashLine)
+        self._end_pen = QPen(QColor("#00ff00"))
+        self._end_pen.setWidth(2)
+        self._end_pen.setStyle(Qt.PenStyle.DashLine)
+
+        # Preview slider moves are coalesced and applied at most once per frame
+        self._pending_y: float | None = None
+        self._anim_timer = QTimer(self)
+        self._anim_timer.setInterval(16)
+        self._anim_timer.timeout.connect(self._apply_pending_y)
 
         self._build_ui()
 
@@ -76,6 +114,15 @@ class AnimationTab(QWidget):
         self.anim_scene = QGraphicsScene(self)
         self.anim_view = AnimView(self.anim_scene, owner=self)
         self.anim_view.setStyleSheet("background-color: #101010;")
+        # Guide and cap are large pixmaps; repainting the whole viewport is
+        # cheaper than working out minimal update regions on every cap move.
+        self.anim_view.setViewportUpdateMode(
+            QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+        )
+        self.anim_view.setOptimizationFlag(
+            QGraphicsView.OptimizationFlag.DontSavePainterState, True
+        )
+        self.anim_view.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
 
         main_layout.addWidget(self.anim_view, stretch=3)
 
@@ -156,13 +203,17 @@ class AnimationTab(QWidget):
         )
         if path:
             self.guide_path = Path(path)
-            pixmap = QPixmap(str(self.guide_path))
+            self._guide_np = _load_rgba(self.guide_path)
+            pixmap = _pixmap_from_rgba(self._guide_np)
 
             if self.guide_item is not None:
                 self.anim_scene.removeItem(self.guide_item)
 
             self.guide_item = QGraphicsPixmapItem(pixmap)
             self.guide_item.setZValue(0)
+            self.guide_item.setCacheMode(
+                QGraphicsPixmapItem.CacheMode.DeviceCoordinateCache
+            )
             self.anim_scene.addItem(self.guide_item)
 
             self._refresh_scene_rect()
@@ -173,7 +224,9 @@ class AnimationTab(QWidget):
         )
         if path:
             self.cap_path = Path(path)
-            pixmap = QPixmap(str(self.cap_path))
+            self._cap_np = _load_rgba(self.cap_path)
+            self._cap_premul = premultiply(self._cap_np)
+            pixmap = _pixmap_from_rgba(self._cap_np)
 
             if self.cap_item is not None:
                 self.anim_scene.removeItem(self.cap_item)
@@ -227,13 +280,14 @@ class AnimationTab(QWidget):
         ):
             return
         t = value / 100.0
-        y = self.start_edge_y + t * (self.end_edge_y - self.start_edge_y)
-        self.cap_item.setY(y)
+        self._pending_y = self.start_edge_y + t * (self.end_edge_y - self.start_edge_y)
+        if not self._anim_timer.isActive():
+            self._anim_timer.start()
 
     def on_export_spritesheet(self) -> None:
         if (
-            self.guide_path is None
-            or self.cap_path is None
+            self._guide_np is None
+            or self._cap_np is None
             or self.start_edge_y is None
             or self.end_edge_y is None
         ):
@@ -242,48 +296,89 @@ class AnimationTab(QWidget):
         output_dir = Path("output").resolve()
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        guide_img = Image.open(self.guide_path).convert("RGBA")
-        cap_img = Image.open(self.cap_path).convert("RGBA")
-
         frames = self.frames_spin.value()
         layout = self.layout_combo.currentText()
         offset = self.offset_spin.value()
 
         cap_x = int(self.cap_item.x()) if self.cap_item else 0
 
-        frame_width = guide_img.width
-        frame_height = guide_img.height
+        guide_np = self._guide_np
+        cap_np = self._cap_np
+        cap_premul = self._cap_premul
+        frame_height, frame_width = guide_np.shape[:2]
+
+        cap_ys = np.linspace(self.start_edge_y, self.end_edge_y, frames)
+        cap_ys = cap_ys.astype(np.int32)
+        sheet_path = output_dir / "fader_spritesheet.png"
 
         if layout == "Horizontal":
+            # The sheet is only one frame tall, so it is built in one go
             sheet_width = frame_width * frames + offset * (frames - 1)
-            sheet_height = frame_height
+            frame_xs = np.arange(frames, dtype=np.int32) * (frame_width + offset)
+            sheet = np.zeros((frame_height, sheet_width, 4), dtype=np.uint8)
+            frame_ys = np.zeros_like(frame_xs)
+            composite_frames(
+                sheet, guide_np, cap_np, cap_premul, cap_ys, cap_x, frame_xs, frame_ys
+            )
+            rows = (sheet[y : y + 64] for y in range(0, frame_height, 64))
+            write_png_rows(sheet_path, sheet_width, frame_height, rows)
         else:
-            sheet_width = frame_width
+            # Stream a batch of frames at a time so tall sheets never sit in memory
             sheet_height = frame_height * frames + offset * (frames - 1)
-
-        sheet = Image.new("RGBA", (sheet_width, sheet_height), (0, 0, 0, 0))
-
-        for i in range(frames):
-            t = i / (frames - 1) if frames > 1 else 0
-            cap_y = int(self.start_edge_y + t * (self.end_edge_y - self.start_edge_y))
-
-            frame = guide_img.copy()
-            frame.paste(cap_img, (cap_x, cap_y), cap_img)
-
-            if layout == "Horizontal":
-                x = i * (frame_width + offset)
-                y = 0
-            else:
-                x = 0
-                y = i * (frame_height + offset)
-
-            sheet.paste(frame, (x, y))
-
-        sheet_path = output_dir / "fader_spritesheet.png"
-        sheet.save(sheet_path)
+            write_png_rows(
+                sheet_path,
+                frame_width,
+                sheet_height,
+                self._iter_vertical_frames(
+                    guide_np, cap_np, cap_premul, cap_ys, cap_x, offset
+                ),
+            )
 
     # ------------------------------------------------------------------ Helpers
 
+    def _apply_pending_y(self) -> None:
+        """Move the cap to the latest slider position, or go idle if nothing changed."""
+        if self._pending_y is None or self.cap_item is None:
+            self._anim_timer.stop()
+            return
+        self.cap_item.setY(self._pending_y)
+        self._pending_y = None
+
+    @staticmethod
+    def _iter_vertical_frames(
+        guide: np.ndarray,
+        cap: np.ndarray,
+        cap_premul: np.ndarray,
+        cap_ys: np.ndarray,
+        cap_x: int,
+        offset: int,
+    ) -> Iterator[np.ndarray]:
+        """Yield the rows of a vertical spritesheet a batch of frames at a time."""
+        frame_height, frame_width = guide.shape[:2]
+        stride = frame_height + offset
+        count = len(cap_ys)
+        batch = min(_VERTICAL_BATCH_FRAMES, count)
+        # Frame slots are fully rewritten per batch; the gap rows between
+        # them are never touched and stay transparent
+        block = np.zeros((batch * stride, frame_width, 4), dtype=np.uint8)
+        slot_ys = np.arange(batch, dtype=np.int32) * stride
+        slot_xs = np.zeros(batch, dtype=np.int32)
+        for start in range(0, count, batch):
+            n = min(batch, count - start)
+            composite_frames(
+                block,
+                guide,
+                cap,
+                cap_premul,
+                cap_ys[start : start + n],
+                cap_x,
+                slot_xs[:n],
+                slot_ys[:n],
+            )
+            # No gap after the sheet's last frame
+            rows = n * stride - (offset if start + n == count else 0)
+            yield block[:rows]
+
     def _refresh_scene_rect(self) -> None:
         rect = self.anim_scene.itemsBoundingRect()
         margin = 50
@@ -292,31 +387,27 @@ class AnimationTab(QWidget):
         self.anim_view.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
 
     def _update_edge_lines(self) -> None:
-        pen = QPen(QColor("#ff0000"))
-        pen.setWidth(2)
-        pen.setStyle(Qt.PenStyle.DashLine)
-
         rect = self.anim_scene.sceneRect()
+        self.start_line_item = self._update_edge_line(
+            self.start_line_item, self.start_edge_y, self._start_pen, rect
+        )
+        self.end_line_item = self._update_edge_line(
+            self.end_line_item, self.end_edge_y, self._end_pen, rect
+        )
 
-        if self.start_line_item is not None:
-            self.anim_scene.removeItem(self.start_line_item)
-        if self.start_edge_y is not None:
-            self.start_line_item = QGraphicsLineItem(
-                rect.left(), self.start_edge_y, rect.right(), self.start_edge_y
-            )
-            self.start_line_item.setPen(pen)
-            self.anim_scene.addItem(self.start_line_item)
-
-        pen_end = QPen(QColor("#00ff00"))
-        pen_end.setWidth(2)
-        pen_end.setStyle(Qt.PenStyle.DashLine)
-
-        if self.end_line_item is not None:
-            self.anim_scene.removeItem(self.end_line_item)
-        if self.end_edge_y is not None:
-            self.end_line_item = QGraphicsLineItem(
-                rect.left(), self.end_edge_y, rect.right(), self.end_edge_y
-            )
-            self.end_line_item.setPen(pen_end)
-            self.anim_scene.addItem(self.end_line_item)
-
+    def _update_edge_line(
+        self,
+        item: QGraphicsLineItem | None,
+        y: float | None,
+        pen: QPen,
+        rect: QRectF,
+    ) -> QGraphicsLineItem | None:
+        """Move an edge marker to `y`, creating it on first use."""
+        if y is None:
+            return item
+        if item is None:
+            item = QGraphicsLineItem()
+            item.setPen(pen)
+            self.anim_scene.addItem(item)
+        item.setLine(rect.left(), y, rect.right(), y)
+        return item
@@ -9,8 +9,8 @@ Background Removal Tab - Contains UI and logic for:
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import (
     QFormLayout,
     QGroupBox,
@@ -24,15 +24,30 @@ from PyQt6.QtWidgets import (
     QFileDialog,
 )
 
+import numpy as np
 from PIL import Image
-from process_fader_image import remove_black_background, split_components
+from process_fader_image import load_rgba, remove_black_background, split_components
 
 if TYPE_CHECKING:
     from gui import MainWindow
 
 
-def load_pixmap(path: Path, max_size: int = 480) -> QPixmap:
+def _transformation(smooth: bool) -> Qt.TransformationMode:
+    if smooth:
+        return Qt.TransformationMode.SmoothTransformation
+    return Qt.TransformationMode.FastTransformation
+
+
+def load_pixmap(path: Path, max_size: int = 480, smooth: bool = False) -> QPixmap:
     """Load an image file into a QPixmap and scale it down to fit max_size."""
+    if path.suffix.lower() in (".jpg", ".jpeg"):
+        # Let libjpeg downscale while decoding (DCT scaling) instead of
+        # decoding the full resolution only to shrink it afterwards.
+        with Image.open(path) as img:
+            img.draft("RGB", (max_size, max_size))
+            rgba = np.asarray(img.convert("RGBA"))
+        return pixmap_from_ndarray(rgba, max_size, smooth)
+
     pixmap = QPixmap(str(path))
     if pixmap.isNull():
         return pixmap
@@ -41,10 +56,77 @@ def load_pixmap(path: Path, max_size: int = 480) -> QPixmap:
         max_size,
         max_size,
         Qt.AspectRatioMode.KeepAspectRatio,
-        Qt.TransformationMode.SmoothTransformation,
+        _transformation(smooth),
+    )
+
+
+def pixmap_from_ndarray(
+    arr: np.ndarray, max_size: int = 480, smooth: bool = False
+) -> QPixmap:
+    """Convert an RGBA array into a QPixmap scaled down to fit max_size."""
+    h, w = arr.shape[:2]
+    image = QImage(arr.data, w, h, 4 * w, QImage.Format.Format_RGBA8888)
+    return QPixmap.fromImage(image).scaled(
+        max_size,
+        max_size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        _transformation(smooth),
     )
 
 
+def build_preview(no_bg: np.ndarray, min_area: int) -> tuple[np.ndarray, int]:
+    """
+    Split a background-removed image and return its preview image.
+
+    The preview is the composite of all kept components, or `no_bg` itself
+    if none survive `min_area`.
+    """
+    components = split_components(no_bg, min_area=min_area)
+    if not components:
+        return no_bg, 0
+
+    # Components never overlap, so compositing is a masked copy confined to
+    # each component's bounding box
+    composite = np.zeros_like(no_bg)
+    for (x0, y0, x1, y1), crop in components:
+        np.copyto(composite[y0:y1, x0:x1], crop, where=crop[:, :, 3:] > 0)
+    return composite, len(components)
+
+
+class _PreviewSignals(QObject):
+    # request id, threshold, background-removed image, preview, components
+    finished = pyqtSignal(int, int, object, object, int)
+
+
+class _PreviewTask(QRunnable):
+    """Computes a background-tab preview on the global thread pool."""
+
+    def __init__(
+        self,
+        request_id: int,
+        rgba: np.ndarray,
+        threshold: int,
+        min_area: int,
+        no_bg: np.ndarray | None = None,
+    ) -> None:
+        super().__init__()
+        self.signals = _PreviewSignals()
+        self._request_id = request_id
+        self._rgba = rgba
+        self._threshold = threshold
+        self._min_area = min_area
+        self._no_bg = no_bg
+
+    def run(self) -> None:
+        no_bg = self._no_bg
+        if no_bg is None:
+            no_bg = remove_black_background(self._rgba, threshold=self._threshold)
+        preview, count = build_preview(no_bg, self._min_area)
+        self.signals.finished.emit(
+            self._request_id, self._threshold, no_bg, preview, count
+        )
+
+
 class BackgroundTab(QWidget):
     """Tab widget for background removal and component splitting."""
 
@@ -52,8 +134,20 @@ class BackgroundTab(QWidget):
         super().__init__()
         self._owner = owner
         self.input_path: Path | None = None
-        self.preview_dir = Path("preview").resolve()
-        self.preview_dir.mkdir(parents=True, exist_ok=True)
+        # Decoded source image, kept so parameter changes don't re-read the file
+        self._img_rgba: np.ndarray | None = None
+
+        # Slider drags fire many valueChanged signals; only recompute once the
+        # parameters have settled.
+        self._recompute_timer = QTimer(self)
+        self._recompute_timer.setSingleShot(True)
+        self._recompute_timer.timeout.connect(self._recompute)
+        # Only the newest preview request is shown; older results are dropped
+        self._request_id = 0
+        # Background-removed images of the current source keyed by threshold,
+        # so min-area changes only re-run the component split
+        self._nobg_cache: dict[int, np.ndarray] = {}
+
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -134,45 +228,18 @@ class BackgroundTab(QWidget):
         )
         if path:
             self.input_path = Path(path)
+            self._img_rgba = load_rgba(self.input_path)
+            self._nobg_cache.clear()
             self._update_original_preview()
-            self.on_params_changed()
+            self._recompute()
 
     def on_params_changed(self) -> None:
-        if self.input_path is None:
+        if self._img_rgba is None:
             return
-        threshold = self.threshold_slider.value()
-        min_area = self.min_area_spin.value()
-
-        # Process image and generate previews
-        img = Image.open(self.input_path).convert("RGBA")
-        no_bg = remove_black_background(img, threshold=threshold)
-
-        # Split components
-        components = split_components(no_bg, min_area=min_area)
-
-        # Save previews
-        preview_path = self.preview_dir / "no_bg.png"
-        no_bg.save(preview_path)
-
-        # Composite preview with all components
-        if components:
-            composite = Image.new("RGBA", no_bg.size, (0, 0, 0, 0))
-            for i, comp in enumerate(components):
-                # Save each component preview
-                comp_path = self.preview_dir / f"component_{i}.png"
-                comp.save(comp_path)
-                composite = Image.alpha_composite(composite, comp)
-
-            composite_path = self.preview_dir / "composite.png"
-            composite.save(composite_path)
-            self._update_previews(composite_path)
-            self.component_info_label.setText(f"Components: {len(components)}")
-        else:
-            self._update_previews(preview_path)
-            self.component_info_label.setText("Components: 0")
+        self._recompute_timer.start(150)
 
     def on_export_components(self) -> None:
-        if self.input_path is None:
+        if self.input_path is None or self._img_rgba is None:
             return
 
         output_dir = Path("output").resolve()
@@ -181,19 +248,22 @@ class BackgroundTab(QWidget):
         threshold = self.threshold_slider.value()
         min_area = self.min_area_spin.value()
 
-        img = Image.open(self.input_path).convert("RGBA")
-        no_bg = remove_black_background(img, threshold=threshold)
+        no_bg = self._no_bg_for(threshold)
 
         # Save no-background version
         stem = self.input_path.stem
         no_bg_path = output_dir / f"{stem}_no_bg.png"
-        no_bg.save(no_bg_path)
+        Image.fromarray(no_bg).save(no_bg_path)
 
-        # Split and save components
+        # Split and save components, each on a full-size canvas so the files
+        # still line up with the source image
         components = split_components(no_bg, min_area=min_area)
-        for i, comp in enumerate(components):
+        canvas = np.zeros_like(no_bg)
+        for i, ((x0, y0, x1, y1), crop) in enumerate(components):
+            canvas[y0:y1, x0:x1] = crop
             comp_path = output_dir / f"{stem}_component_{i}.png"
-            comp.save(comp_path)
+            Image.fromarray(canvas).save(comp_path)
+            canvas[y0:y1, x0:x1] = 0
 
         self.component_info_label.setText(
             f"Exported {len(components)} components to {output_dir}"
@@ -204,12 +274,53 @@ class BackgroundTab(QWidget):
     def _update_original_preview(self) -> None:
         if self.input_path is None:
             return
-        pixmap = load_pixmap(self.input_path)
+        # Built once per load, so it can afford smooth scaling
+        pixmap = load_pixmap(self.input_path, smooth=True)
         if not pixmap.isNull():
             self.original_label.setPixmap(pixmap)
 
-    def _update_previews(self, processed_path: Path) -> None:
-        pixmap = load_pixmap(processed_path)
-        if not pixmap.isNull():
-            self.processed_label.setPixmap(pixmap)
-
+    def _recompute(self) -> None:
+        """Start computing the preview for the current parameters off the GUI thread."""
+        if self._img_rgba is None:
+            return
+        self._request_id += 1
+        threshold = self.threshold_slider.value()
+        task = _PreviewTask(
+            self._request_id,
+            self._img_rgba,
+            threshold,
+            self.min_area_spin.value(),
+            self._nobg_cache.get(threshold),
+        )
+        task.signals.finished.connect(self._on_preview_ready)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_preview_ready(
+        self,
+        request_id: int,
+        threshold: int,
+        no_bg: np.ndarray,
+        preview: np.ndarray,
+        count: int,
+    ) -> None:
+        if request_id != self._request_id:
+            return
+        self._remember_no_bg(threshold, no_bg)
+        self._update_previews(preview)
+        self.component_info_label.setText(f"Components: {count}")
+
+    def _no_bg_for(self, threshold: int) -> np.ndarray:
+        no_bg = self._nobg_cache.get(threshold)
+        if no_bg is None:
+            no_bg = remove_black_background(self._img_rgba, threshold=threshold)
+            self._remember_no_bg(threshold, no_bg)
+        return no_bg
+
+    def _remember_no_bg(self, threshold: int, no_bg: np.ndarray) -> None:
+        if threshold not in self._nobg_cache and len(self._nobg_cache) >= 16:
+            # Evict the oldest entry
+            del self._nobg_cache[next(iter(self._nobg_cache))]
+        self._nobg_cache[threshold] = no_bg
+
+    def _update_previews(self, rgba: np.ndarray) -> None:
+        self.processed_label.setPixmap(pixmap_from_ndarray(rgba))
@@ -0,0 +1,188 @@
+"""
+Compositing kernels and output helpers shared by the spritesheet exporters.
+
+The kernels are compiled with numba when it is installed. Without numba the
+fallbacks below use Pillow's C compositing instead; both produce the same
+bytes as `Image.alpha_composite`.
+"""
+
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+from PIL import Image
+
+try:
+    import numba
+except ImportError:  # numba is optional
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(inline="always", cache=True)
+    def _div255(x):
+        """Round-to-nearest x / 255 for 0 <= x < 255 * 256, using shifts only."""
+        return ((x >> 8) + x) >> 8
+
+    _RGBA = numba.types.Array(numba.uint8, 3, "C")
+    _RGBA_RO = numba.types.Array(numba.uint8, 3, "C", readonly=True)
+    _RGB16_RO = numba.types.Array(numba.uint16, 3, "C", readonly=True)
+    _INT32S = numba.types.Array(numba.int32, 1, "C")
+
+    # An explicit signature compiles (or loads from the on-disk cache) when
+    # this module is imported, so the first export doesn't stall on the JIT.
+    @numba.njit(
+        numba.void(
+            _RGBA, _RGBA_RO, _RGBA_RO, _RGB16_RO, _INT32S, numba.int32, _INT32S, _INT32S
+        ),
+        parallel=True,
+        cache=True,
+        fastmath=True,
+    )
+    def composite_frames(
+        sheet, guide, cap, cap_premul, cap_ys, cap_x, frame_xs, frame_ys
+    ):
+        """
+        Blit `guide` into every frame slot of `sheet` and composite `cap` over it.
+
+        Args:
+            sheet: Preallocated (H, W, 4) uint8 spritesheet, written in place
+            guide: (frame_h, frame_w, 4) uint8 guide image
+            cap: (cap_h, cap_w, 4) uint8 cap image
+            cap_premul: `premultiply(cap)`, computed once per cap image
+            cap_ys: int32 cap row offset for each frame
+            cap_x: Cap column offset (same for every frame)
+            frame_xs: int32 sheet column of each frame's top-left corner
+            frame_ys: int32 sheet row of each frame's top-left corner
+        """
+        frame_h, frame_w = guide.shape[0], guide.shape[1]
+        cap_h, cap_w = cap.shape[0], cap.shape[1]
+        x0 = max(cap_x, 0)
+        x1 = min(cap_x + cap_w, frame_w)
+
+        for i in numba.prange(cap_ys.shape[0]):
+            ox = frame_xs[i]
+            oy = frame_ys[i]
+            sheet[oy : oy + frame_h, ox : ox + frame_w] = guide
+
+            cap_y = cap_ys[i]
+            y0 = max(cap_y, 0)
+            y1 = min(cap_y + cap_h, frame_h)
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    sa = np.int32(cap[y - cap_y, x - cap_x, 3])
+                    if sa == 0:
+                        continue
+                    da = np.int32(sheet[oy + y, ox + x, 3])
+                    if sa == 255 or da == 0:
+                        sheet[oy + y, ox + x] = cap[y - cap_y, x - cap_x]
+                        continue
+
+                    if da == 255:
+                        # Opaque guide pixel (the common case): the blend
+                        # coefficients reduce to sa and 255 - sa, and the cap
+                        # side is the premultiplied colour.
+                        inv = 255 - sa
+                        for c in range(3):
+                            src = np.int32(cap_premul[y - cap_y, x - cap_x, c])
+                            dst = np.int32(sheet[oy + y, ox + x, c])
+                            sheet[oy + y, ox + x, c] = (
+                                _div255(((src + dst * inv) << 7) + (0x80 << 7)) >> 7
+                            )
+                        continue
+
+                    # Pillow's fixed-point "over": one division per pixel for
+                    # the blend coefficients, shifts instead of "/ 255" for the
+                    # channels, so results match Image.alpha_composite exactly.
+                    blend = da * (255 - sa)
+                    outa255 = sa * 255 + blend
+                    coef1 = sa * 255 * 255 * 128 // outa255
+                    coef2 = 255 * 128 - coef1
+                    for c in range(3):
+                        src = np.int32(cap[y - cap_y, x - cap_x, c])
+                        dst = np.int32(sheet[oy + y, ox + x, c])
+                        sheet[oy + y, ox + x, c] = (
+                            _div255(src * coef1 + dst * coef2 + (0x80 << 7)) >> 7
+                        )
+                    sheet[oy + y, ox + x, 3] = _div255(outa255 + 0x80)
+
+else:
+
+    def composite_frames(
+        sheet, guide, cap, cap_premul, cap_ys, cap_x, frame_xs, frame_ys
+    ):
+        """Pillow fallback for `composite_frames` when numba is not installed."""
+        frame_h, frame_w = guide.shape[:2]
+        cap_h, cap_w = cap.shape[:2]
+
+        guide_img = Image.fromarray(guide, "RGBA")
+        cap_img = Image.fromarray(cap, "RGBA")
+
+        # One transparent guide-sized layer; only the cap's box is touched
+        # per frame, then cleared again.
+        layer = Image.new("RGBA", guide_img.size, (0, 0, 0, 0))
+
+        for cap_y, ox, oy in zip(cap_ys.tolist(), frame_xs.tolist(), frame_ys.tolist()):
+            layer.paste(cap_img, (cap_x, cap_y))
+            frame = Image.alpha_composite(guide_img, layer)
+            sheet[oy : oy + frame_h, ox : ox + frame_w] = np.asarray(frame)
+            layer.paste((0, 0, 0, 0), (cap_x, cap_y, cap_x + cap_w, cap_y + cap_h))
+
+
+def premultiply(rgba: np.ndarray) -> np.ndarray:
+    """
+    Return the exact premultiplied colour (rgb * alpha) of an RGBA image.
+
+    Kept as uint16 products rather than rounded back to 8 bits, so the
+    kernels stay bit-identical to `Image.alpha_composite`.
+    """
+    return rgba[:, :, :3].astype(np.uint16) * rgba[:, :, 3:4]
+
+
+def write_png_rows(
+    path: Path, width: int, height: int, blocks: Iterable[np.ndarray]
+) -> None:
+    """
+    Write an 8-bit RGBA PNG from consecutive blocks of rows.
+
+    Each block is an (n, width, 4) uint8 array. Blocks are filtered and
+    compressed as they arrive, so the whole image never has to be held in
+    memory at once.
+    """
+
+    def write_chunk(f, tag: bytes, data: bytes) -> None:
+        f.write(struct.pack(">I", len(data)))
+        f.write(tag)
+        f.write(data)
+        f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(tag))))
+
+    compressor = zlib.compressobj(6)
+    rows_written = 0
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        write_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+
+        for block in blocks:
+            n = block.shape[0]
+            flat = block.reshape(n, width * 4)
+
+            # "Sub" filter: every byte minus the same channel one pixel left
+            scanlines = np.empty((n, width * 4 + 1), dtype=np.uint8)
+            scanlines[:, 0] = 1
+            scanlines[:, 1:5] = flat[:, :4]
+            np.subtract(flat[:, 4:], flat[:, :-4], out=scanlines[:, 5:])
+
+            data = compressor.compress(scanlines)
+            if data:
+                write_chunk(f, b"IDAT", data)
+            rows_written += n
+
+        if rows_written != height:
+            raise ValueError(f"Expected {height} rows, got {rows_written}.")
+
+        write_chunk(f, b"IDAT", compressor.flush())
+        write_chunk(f, b"IEND", b"")
@@ -4,25 +4,163 @@ Uses supersampling (render at 2x then downscale) for smooth anti-aliased edges.
 """
 
 from PIL import Image, ImageDraw, ImageFilter
+import argparse
+import functools
 import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is optional
+    numba = None
+
 # Supersampling factor for anti-aliasing (2x = render at double size, then downscale)
 SUPERSAMPLE = 2
 
+# Cyberpunk tick mark angles (degrees) and their unit vectors
+_TICK_ANGLES = np.arange(-135, 136, 30)
+_TICK_COS = np.cos(np.radians(_TICK_ANGLES))
+_TICK_SIN = np.sin(np.radians(_TICK_ANGLES))
 
-def create_metallic_knob(size: int = 128, pointer_angle: float = -135) -> Image.Image:
+
+@functools.lru_cache(maxsize=64)
+def _endpoint_table(radius: int) -> tuple:
+    """(x, y) integer offsets of a point at `radius` for every whole degree in [-360, 360)."""
+    rad = np.radians(np.arange(-360, 360))
+    return (
+        (radius * np.cos(rad)).astype(np.int32).tolist(),
+        (radius * np.sin(rad)).astype(np.int32).tolist(),
+    )
+
+
+def _polar_offset(radius: int, angle: float) -> tuple:
     """
-    Create a metallic-style knob with a pointer indicator.
+    Integer (dx, dy) of a point at `radius` and `angle` degrees from the center.
+    
+    Whole-degree angles (the usual case for animation frames) come from a
+    per-radius lookup table; other angles are computed directly.
+    """
+    if float(angle).is_integer() and -360 <= angle < 360:
+        xs, ys = _endpoint_table(radius)
+        i = int(angle) + 360
+        return xs[i], ys[i]
+    rad = math.radians(angle)
+    return int(radius * math.cos(rad)), int(radius * math.sin(rad))
+
+
+def _line_glow(points: list, color: tuple, alpha: int,
+               width: int, radius: float) -> tuple:
+    """
+    Build a soft glow layer for a line.
+    
+    The line is drawn once onto a single-channel mask covering just its
+    bounding box and blurred there; the RGB channels are the flat glow color.
     
     Args:
-        size: Image size in pixels (square)
-        pointer_angle: Angle of the pointer in degrees (0 = right, counter-clockwise)
+        points: Line endpoints
+        color: RGB tuple for the glow
+        alpha: Peak glow opacity (0-255)
+        width: Line width before blurring
+        radius: Gaussian blur radius
     
     Returns:
-        RGBA Image of the knob
+        (RGBA glow Image, (x, y) canvas offset of its top-left corner)
+    """
+    pad = width // 2 + int(math.ceil(3 * radius))
+    x0 = min(x for x, _ in points) - pad
+    y0 = min(y for _, y in points) - pad
+    x1 = max(x for x, _ in points) + pad
+    y1 = max(y for _, y in points) + pad
+    size = (x1 - x0 + 1, y1 - y0 + 1)
+    
+    mask = Image.new("L", size, 0)
+    local = [(x - x0, y - y0) for x, y in points]
+    ImageDraw.Draw(mask).line(local, fill=alpha, width=width)
+    mask = _blur_mask(mask, radius)
+    channels = [Image.new("L", size, c) for c in color]
+    return Image.merge("RGBA", (*channels, mask)), (x0, y0)
+
+
+def _blur_mask(mask: Image.Image, radius: float) -> Image.Image:
+    """
+    Blur a single-channel mask.
+    
+    Pillow's GaussianBlur already runs as extended box passes, so its cost
+    per pixel does not grow with the radius.
+    """
+    return mask.filter(ImageFilter.GaussianBlur(radius=radius))
+
+
+def _glow_padding(radius: float) -> int:
+    """Margin a mask needs so `_blur_mask` never reaches the canvas edge."""
+    return 3 * int(math.ceil(radius)) + 1
+
+
+def _mask_glow(mask: Image.Image, color: tuple, radius: float,
+               strength: float = 0.2) -> Image.Image:
+    """
+    Build a glow layer from a blurred coverage mask.
+    
+    Args:
+        mask: "L" image of everything that should glow
+        color: RGB tuple of the glow tint
+        radius: Blur radius
+        strength: Brightness of the tint relative to `color`
+    
+    Returns:
+        RGBA Image the same size as the mask
+    """
+    blurred = _blur_mask(mask, radius)
+    channels = [Image.new("L", mask.size, int(c * strength)) for c in color]
+    return Image.merge("RGBA", (*channels, blurred))
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _fill_metallic(out, size, center, inner_radius):
+        """Write the metallic body gradient into `out`, in a single fused pass."""
+        ir2 = inner_radius * inner_radius
+        for y in numba.prange(size):
+            dy = y - center
+            for x in range(size):
+                dx = x - center
+                r2 = dx * dx + dy * dy
+                if r2 <= ir2:
+                    g = int(80 + 60 * (math.sqrt(r2) / inner_radius))
+                    out[y, x, 0] = g
+                    out[y, x, 1] = g
+                    out[y, x, 2] = min(g + 5, 255)
+                    out[y, x, 3] = 255
+
+else:
+
+    def _fill_metallic(out, size, center, inner_radius):
+        """NumPy fallback for `_fill_metallic` when numba is not installed."""
+        yy, xx = np.ogrid[:size, :size]
+        r = np.sqrt((xx - center) ** 2 + (yy - center) ** 2)
+        gray = np.clip(80 + 60 * (r / inner_radius), 0, 255).astype(np.uint8)
+        mask = r <= inner_radius
+        out[mask, 0] = gray[mask]
+        out[mask, 1] = gray[mask]
+        out[mask, 2] = np.minimum(gray[mask].astype(np.uint16) + 5, 255)
+        out[mask, 3] = 255
+
+
+@functools.lru_cache(maxsize=16)
+def _metallic_base(size: int) -> Image.Image:
+    """
+    Render the parts of the metallic knob that don't depend on the pointer.
+    
+    The result is cached and shared; callers must copy it before drawing.
+    
+    Returns:
+        RGBA Image at supersampled resolution
     """
-    # Render at higher resolution for anti-aliasing
     render_size = size * SUPERSAMPLE
     img = Image.new("RGBA", (render_size, render_size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -30,7 +168,6 @@ def create_metallic_knob(size: int = 128, pointer_angle: float = -135) -> Image.
     center = render_size // 2
     outer_radius = render_size // 2 - 4 * SUPERSAMPLE
     inner_radius = outer_radius - 8 * SUPERSAMPLE
-    pointer_radius = inner_radius - 6 * SUPERSAMPLE
     
     # Outer ring (dark edge)
     draw.ellipse(
@@ -41,16 +178,11 @@ def create_metallic_knob(size: int = 128, pointer_angle: float = -135) -> Image.
         width=2 * SUPERSAMPLE
     )
     
-    # Main knob body with gradient-like effect
-    for i in range(inner_radius, 0, -2 * SUPERSAMPLE):
-        # Create a gradient from light gray to darker
-        t = i / inner_radius
-        gray = int(80 + 60 * t)
-        color = (gray, gray, gray + 5, 255)
-        draw.ellipse(
-            [center - i, center - i, center + i, center + i],
-            fill=color
-        )
+    # Main knob body: radial gradient from dark gray (center) to light gray (edge)
+    body = np.zeros((render_size, render_size, 4), dtype=np.uint8)
+    _fill_metallic(body, render_size, center, inner_radius)
+    body_img = Image.fromarray(body, "RGBA")
+    img.paste(body_img, (0, 0), body_img)
     
     # Highlight on top-left
     highlight_offset = inner_radius // 3
@@ -59,13 +191,35 @@ def create_metallic_knob(size: int = 128, pointer_angle: float = -135) -> Image.
          center - highlight_offset + 15 * SUPERSAMPLE, center - highlight_offset + 15 * SUPERSAMPLE],
         fill=(180, 180, 185, 100)
     )
+    return img
+
+
+def create_metallic_knob(size: int = 128, pointer_angle: float = -135) -> Image.Image:
+    """
+    Create a metallic-style knob with a pointer indicator.
+    
+    Args:
+        size: Image size in pixels (square)
+        pointer_angle: Angle of the pointer in degrees (0 = right, counter-clockwise)
+    
+    Returns:
+        RGBA Image of the knob
+    """
+    # Render at higher resolution for anti-aliasing
+    render_size = size * SUPERSAMPLE
+    img = _metallic_base(size).copy()
+    draw = ImageDraw.Draw(img)
+    
+    center = render_size // 2
+    outer_radius = render_size // 2 - 4 * SUPERSAMPLE
+    inner_radius = outer_radius - 8 * SUPERSAMPLE
+    pointer_radius = inner_radius - 6 * SUPERSAMPLE
     
     # Pointer/indicator line
-    rad = math.radians(pointer_angle)
-    px1 = center + int(10 * SUPERSAMPLE * math.cos(rad))
-    py1 = center + int(10 * SUPERSAMPLE * math.sin(rad))
-    px2 = center + int(pointer_radius * math.cos(rad))
-    py2 = center + int(pointer_radius * math.sin(rad))
+    dx1, dy1 = _polar_offset(10 * SUPERSAMPLE, pointer_angle)
+    dx2, dy2 = _polar_offset(pointer_radius, pointer_angle)
+    px1, py1 = center + dx1, center + dy1
+    px2, py2 = center + dx2, center + dy2
     
     # Pointer shadow
     draw.line([(px1 + 2 * SUPERSAMPLE, py1 + 2 * SUPERSAMPLE), (px2 + 2 * SUPERSAMPLE, py2 + 2 * SUPERSAMPLE)], 
@@ -89,22 +243,20 @@ def create_metallic_knob(size: int = 128, pointer_angle: float = -135) -> Image.
     return img
 
 
-def create_neon_knob(size: int = 128, pointer_angle: float = -135, 
-                     color: tuple = (0, 229, 255)) -> Image.Image:
+@functools.lru_cache(maxsize=16)
+def _neon_base(size: int, color: tuple) -> tuple:
     """
-    Create a neon-style knob with glowing edges.
+    Render the parts of the neon knob that don't depend on the pointer.
     
-    Args:
-        size: Image size in pixels
-        pointer_angle: Angle of the pointer in degrees
-        color: RGB tuple for the neon color
+    The results are cached and shared; callers must copy them before drawing.
     
     Returns:
-        RGBA Image of the knob
+        (body, glow) RGBA Images at supersampled resolution; the glow is
+        already blurred and goes behind the body
     """
-    # Render at higher resolution for anti-aliasing
     render_size = size * SUPERSAMPLE
-    glow_padding = 20 * SUPERSAMPLE
+    glow_radius = 4 * SUPERSAMPLE
+    glow_padding = _glow_padding(glow_radius)
     full_size = render_size + glow_padding * 2
     img = Image.new("RGBA", (full_size, full_size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -112,7 +264,6 @@ def create_neon_knob(size: int = 128, pointer_angle: float = -135,
     center = full_size // 2
     outer_radius = render_size // 2 - 4 * SUPERSAMPLE
     inner_radius = outer_radius - 6 * SUPERSAMPLE
-    pointer_radius = inner_radius - 8 * SUPERSAMPLE
     
     r, g, b = color
     
@@ -138,17 +289,53 @@ def create_neon_knob(size: int = 128, pointer_angle: float = -135,
         fill=(20, 20, 25, 255)
     )
     
-    # Pointer/indicator
-    rad = math.radians(pointer_angle)
-    px1 = center + int(12 * SUPERSAMPLE * math.cos(rad))
-    py1 = center + int(12 * SUPERSAMPLE * math.sin(rad))
-    px2 = center + int(pointer_radius * math.cos(rad))
-    py2 = center + int(pointer_radius * math.sin(rad))
+    # Glow: blur only the alpha channel and tint it with a dimmed neon color.
+    # The pointer stays inside the opaque disc, so the mask doesn't depend on it.
+    glow = _mask_glow(img.getchannel("A"), color, radius=glow_radius)
+    
+    # Only the blur needs the padding; frames are drawn at render size
+    crop_box = (glow_padding, glow_padding, glow_padding + render_size, glow_padding + render_size)
+    return img.crop(crop_box), glow.crop(crop_box)
+
+
+def create_neon_knob(size: int = 128, pointer_angle: float = -135, 
+                     color: tuple = (0, 229, 255)) -> Image.Image:
+    """
+    Create a neon-style knob with glowing edges.
+    
+    Args:
+        size: Image size in pixels
+        pointer_angle: Angle of the pointer in degrees
+        color: RGB tuple for the neon color
+    
+    Returns:
+        RGBA Image of the knob
+    """
+    # Render at higher resolution for anti-aliasing
+    render_size = size * SUPERSAMPLE
+    body, glow_layer = _neon_base(size, tuple(color))
+    img = body.copy()
+    draw = ImageDraw.Draw(img)
+    
+    center = render_size // 2
+    outer_radius = render_size // 2 - 4 * SUPERSAMPLE
+    inner_radius = outer_radius - 6 * SUPERSAMPLE
+    pointer_radius = inner_radius - 8 * SUPERSAMPLE
     
-    # Pointer glow (draw multiple times with decreasing alpha)
-    for glow in range(8 * SUPERSAMPLE, 0, -2 * SUPERSAMPLE):
-        alpha = max(10, 50 - glow * 3)
-        draw.line([(px1, py1), (px2, py2)], fill=(r, g, b, alpha), width=glow + 4 * SUPERSAMPLE)
+    r, g, b = color
+    
+    # Pointer/indicator
+    dx1, dy1 = _polar_offset(12 * SUPERSAMPLE, pointer_angle)
+    dx2, dy2 = _polar_offset(pointer_radius, pointer_angle)
+    px1, py1 = center + dx1, center + dy1
+    px2, py2 = center + dx2, center + dy2
+    
+    # Pointer glow (one soft line, blurred so it fades out with distance)
+    glow, offset = _line_glow(
+        [(px1, py1), (px2, py2)], (r, g, b),
+        alpha=140, width=12 * SUPERSAMPLE, radius=SUPERSAMPLE
+    )
+    img.alpha_composite(glow, dest=offset)
     
     # Pointer main
     draw.line([(px1, py1), (px2, py2)], fill=(r, g, b, 255), width=3 * SUPERSAMPLE)
@@ -162,38 +349,29 @@ def create_neon_knob(size: int = 128, pointer_angle: float = -135,
         fill=(r, g, b, 255)
     )
     
-    # Apply gaussian blur for glow effect
-    glow_layer = img.copy()
-    glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=4 * SUPERSAMPLE))
-    
-    # Composite glow behind main image
-    result = Image.new("RGBA", (full_size, full_size), (0, 0, 0, 0))
-    result = Image.alpha_composite(result, glow_layer)
-    result = Image.alpha_composite(result, img)
-    
-    # Crop to render size (removing glow padding)
-    crop_box = (glow_padding, glow_padding, glow_padding + render_size, glow_padding + render_size)
-    result = result.crop(crop_box)
+    # Composite glow behind main image (the glow layer itself serves as the
+    # canvas, since compositing it onto a blank one would just copy it)
+    result = Image.alpha_composite(glow_layer, img)
     
     # Downscale with high-quality resampling for anti-aliased edges
     result = result.resize((size, size), Image.Resampling.LANCZOS)
     return result
 
 
-def create_cyberpunk_knob(size: int = 128, pointer_angle: float = -135) -> Image.Image:
+@functools.lru_cache(maxsize=16)
+def _cyberpunk_base(size: int) -> tuple:
     """
-    Create a cyberpunk-style knob with minimal neon lines and cyan pointer.
+    Render the parts of the cyberpunk knob that don't depend on the pointer.
     
-    Args:
-        size: Image size in pixels
-        pointer_angle: Angle of the pointer in degrees
+    The results are cached and shared; callers must copy them before drawing.
     
     Returns:
-        RGBA Image of the knob
+        (body, glow) RGBA Images at supersampled resolution; the glow is
+        already blurred and goes behind the body
     """
-    # Render at higher resolution for anti-aliasing
     render_size = size * SUPERSAMPLE
-    glow_padding = 20 * SUPERSAMPLE
+    glow_radius = 3 * SUPERSAMPLE
+    glow_padding = _glow_padding(glow_radius)
     full_size = render_size + glow_padding * 2
     img = Image.new("RGBA", (full_size, full_size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -201,7 +379,6 @@ def create_cyberpunk_knob(size: int = 128, pointer_angle: float = -135) -> Image
     center = full_size // 2
     outer_radius = render_size // 2 - 6 * SUPERSAMPLE
     inner_radius = outer_radius - 15 * SUPERSAMPLE
-    pointer_radius = inner_radius - 5 * SUPERSAMPLE
     
     # Cyberpunk colors
     cyan = (0, 255, 255)
@@ -216,45 +393,76 @@ def create_cyberpunk_knob(size: int = 128, pointer_angle: float = -135) -> Image
     )
     
     # Outer ring - magenta accent
-    draw.arc(
+    draw.ellipse(
         [center - outer_radius, center - outer_radius,
          center + outer_radius, center + outer_radius],
-        start=0, end=360,
-        fill=(*magenta, 180),
+        outline=(*magenta, 180),
         width=2 * SUPERSAMPLE
     )
     
     # Inner ring - cyan
-    draw.arc(
+    draw.ellipse(
         [center - inner_radius, center - inner_radius,
          center + inner_radius, center + inner_radius],
-        start=0, end=360,
-        fill=(*cyan, 150),
+        outline=(*cyan, 150),
         width=1 * SUPERSAMPLE
     )
     
     # Tick marks around the edge
-    for angle in range(-135, 136, 30):
-        rad = math.radians(angle)
-        tick_start = outer_radius - 4 * SUPERSAMPLE
-        tick_end = outer_radius + 2 * SUPERSAMPLE
-        x1 = center + int(tick_start * math.cos(rad))
-        y1 = center + int(tick_start * math.sin(rad))
-        x2 = center + int(tick_end * math.cos(rad))
-        y2 = center + int(tick_end * math.sin(rad))
+    tick_start = outer_radius - 4 * SUPERSAMPLE
+    tick_end = outer_radius + 2 * SUPERSAMPLE
+    x1s = center + (tick_start * _TICK_COS).astype(int)
+    y1s = center + (tick_start * _TICK_SIN).astype(int)
+    x2s = center + (tick_end * _TICK_COS).astype(int)
+    y2s = center + (tick_end * _TICK_SIN).astype(int)
+    for x1, y1, x2, y2 in zip(x1s.tolist(), y1s.tolist(), x2s.tolist(), y2s.tolist()):
         draw.line([(x1, y1), (x2, y2)], fill=(*magenta, 200), width=1 * SUPERSAMPLE)
     
+    # Glow (the pointer stays inside the opaque disc, so it doesn't affect the mask)
+    glow = _mask_glow(img.getchannel("A"), magenta, radius=glow_radius, strength=0.1)
+    
+    # Only the blur needs the padding; frames are drawn at render size
+    crop_box = (glow_padding, glow_padding, glow_padding + render_size, glow_padding + render_size)
+    return img.crop(crop_box), glow.crop(crop_box)
+
+
+def create_cyberpunk_knob(size: int = 128, pointer_angle: float = -135) -> Image.Image:
+    """
+    Create a cyberpunk-style knob with minimal neon lines and cyan pointer.
+    
+    Args:
+        size: Image size in pixels
+        pointer_angle: Angle of the pointer in degrees
+    
+    Returns:
+        RGBA Image of the knob
+    """
+    # Render at higher resolution for anti-aliasing
+    render_size = size * SUPERSAMPLE
+    body, glow_layer = _cyberpunk_base(size)
+    img = body.copy()
+    draw = ImageDraw.Draw(img)
+    
+    center = render_size // 2
+    outer_radius = render_size // 2 - 6 * SUPERSAMPLE
+    inner_radius = outer_radius - 15 * SUPERSAMPLE
+    pointer_radius = inner_radius - 5 * SUPERSAMPLE
+    
+    # Pointer color
+    cyan = (0, 255, 255)
+    
     # Pointer line - cyan, thin
-    rad = math.radians(pointer_angle)
-    px1 = center + int(8 * SUPERSAMPLE * math.cos(rad))
-    py1 = center + int(8 * SUPERSAMPLE * math.sin(rad))
-    px2 = center + int(pointer_radius * math.cos(rad))
-    py2 = center + int(pointer_radius * math.sin(rad))
+    dx1, dy1 = _polar_offset(8 * SUPERSAMPLE, pointer_angle)
+    dx2, dy2 = _polar_offset(pointer_radius, pointer_angle)
+    px1, py1 = center + dx1, center + dy1
+    px2, py2 = center + dx2, center + dy2
     
     # Pointer glow
-    for glow in range(6 * SUPERSAMPLE, 0, -2 * SUPERSAMPLE):
-        alpha = max(10, 40 - glow * 3)
-        draw.line([(px1, py1), (px2, py2)], fill=(*cyan, alpha), width=glow + 2 * SUPERSAMPLE)
+    glow, offset = _line_glow(
+        [(px1, py1), (px2, py2)], cyan,
+        alpha=100, width=8 * SUPERSAMPLE, radius=SUPERSAMPLE
+    )
+    img.alpha_composite(glow, dest=offset)
     
     # Pointer main line
     draw.line([(px1, py1), (px2, py2)], fill=(*cyan, 255), width=2 * SUPERSAMPLE)
@@ -267,42 +475,30 @@ def create_cyberpunk_knob(size: int = 128, pointer_angle: float = -135) -> Image
         fill=(*cyan, 255)
     )
     
-    # Apply glow
-    glow_layer = img.copy()
-    glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=3 * SUPERSAMPLE))
-    
-    result = Image.new("RGBA", (full_size, full_size), (0, 0, 0, 0))
-    result = Image.alpha_composite(result, glow_layer)
-    result = Image.alpha_composite(result, img)
-    
-    # Crop to render size (removing glow padding)
-    crop_box = (glow_padding, glow_padding, glow_padding + render_size, glow_padding + render_size)
-    result = result.crop(crop_box)
+    # Composite glow behind main image
+    result = Image.alpha_composite(glow_layer, img)
     
     # Downscale with high-quality resampling for anti-aliased edges
     result = result.resize((size, size), Image.Resampling.LANCZOS)
     return result
 
 
-def create_simple_knob(size: int = 128, pointer_angle: float = -135) -> Image.Image:
+@functools.lru_cache(maxsize=16)
+def _simple_base(size: int) -> Image.Image:
     """
-    Create a simple flat knob design.
+    Render the parts of the simple knob that don't depend on the pointer.
     
-    Args:
-        size: Image size in pixels
-        pointer_angle: Angle of the pointer in degrees
+    The result is cached and shared; callers must copy it before drawing.
     
     Returns:
-        RGBA Image of the knob
+        RGBA Image at supersampled resolution
     """
-    # Render at higher resolution for anti-aliasing
     render_size = size * SUPERSAMPLE
     img = Image.new("RGBA", (render_size, render_size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     
     center = render_size // 2
     outer_radius = render_size // 2 - 4 * SUPERSAMPLE
-    pointer_radius = outer_radius - 12 * SUPERSAMPLE
     
     # Main circle
     draw.ellipse(
@@ -312,13 +508,34 @@ def create_simple_knob(size: int = 128, pointer_angle: float = -135) -> Image.Im
         outline=(80, 80, 85, 255),
         width=2 * SUPERSAMPLE
     )
+    return img
+
+
+def create_simple_knob(size: int = 128, pointer_angle: float = -135) -> Image.Image:
+    """
+    Create a simple flat knob design.
+    
+    Args:
+        size: Image size in pixels
+        pointer_angle: Angle of the pointer in degrees
+    
+    Returns:
+        RGBA Image of the knob
+    """
+    # Render at higher resolution for anti-aliasing
+    render_size = size * SUPERSAMPLE
+    img = _simple_base(size).copy()
+    draw = ImageDraw.Draw(img)
+    
+    center = render_size // 2
+    outer_radius = render_size // 2 - 4 * SUPERSAMPLE
+    pointer_radius = outer_radius - 12 * SUPERSAMPLE
     
     # Pointer
-    rad = math.radians(pointer_angle)
+    dx2, dy2 = _polar_offset(pointer_radius, pointer_angle)
     px1 = center
     py1 = center
-    px2 = center + int(pointer_radius * math.cos(rad))
-    py2 = center + int(pointer_radius * math.sin(rad))
+    px2, py2 = center + dx2, center + dy2
     
     draw.line([(px1, py1), (px2, py2)], fill=(255, 255, 255, 255), width=3 * SUPERSAMPLE)
     
@@ -335,7 +552,85 @@ def create_simple_knob(size: int = 128, pointer_angle: float = -135) -> Image.Im
     return img
 
 
+# Knob generators by style name; each takes (size, pointer_angle) plus any style options
+KNOB_STYLES = {
+    "metallic": create_metallic_knob,
+    "neon": create_neon_knob,
+    "cyberpunk": create_cyberpunk_knob,
+    "simple": create_simple_knob,
+}
+
+
+# Below this many frames, starting worker processes costs more than it saves
+_PARALLEL_MIN_FRAMES = 16
+
+
+def _render_frame(style: str, size: int, color: tuple | None, angle: float) -> np.ndarray:
+    """Render a single frame as an RGBA array (module level so workers can pickle it)."""
+    create = KNOB_STYLES[style]
+    kwargs = {} if color is None else {"color": color}
+    return np.asarray(create(size, angle, **kwargs))
+
+
+def render_frames(style: str, size: int, angles, color: tuple | None = None) -> list:
+    """
+    Render one knob image per pointer angle.
+    
+    Everything except the pointer is rendered once per (style, size, color)
+    and reused, so each frame only costs drawing the pointer. Larger frame
+    counts are spread over worker processes in contiguous chunks, so each
+    worker builds the cached base only once.
+    
+    Args:
+        style: Key of KNOB_STYLES
+        size: Frame size in pixels
+        angles: Pointer angles in degrees, one per frame
+        color: RGB tuple for styles that take a color (neon)
+    
+    Returns:
+        List of (size, size, 4) uint8 RGBA arrays
+    """
+    render = functools.partial(_render_frame, style, size, color)
+    angles = [float(a) for a in angles]
+    if len(angles) < _PARALLEL_MIN_FRAMES:
+        return [render(angle) for angle in angles]
+    
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(angles) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render, angles, chunksize=chunksize))
+
+
+def save_spritesheet(frames: list, path: Path) -> None:
+    """
+    Save equally sized RGBA frames side by side as a horizontal spritesheet.
+    
+    The whole atlas goes through the PNG encoder once, at zlib level 1:
+    faster than Pillow's default of 6, at the cost of a somewhat larger file.
+    """
+    atlas = np.concatenate(frames, axis=1)
+    Image.fromarray(atlas, "RGBA").save(path, optimize=False, compress_level=1)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate sample knob images for the Knob animation tab."
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=0,
+        help=(
+            "Also export a horizontal spritesheet per 256px style with this many "
+            "frames, sweeping the pointer from -135 to 135 degrees."
+        ),
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    
     output_dir = Path("output").resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -380,6 +675,21 @@ def main():
     metallic_large.save(samples_dir / "knob_metallic_large.png")
     print(f"  ✓ Saved: {samples_dir / 'knob_metallic_large.png'} (512x512)")
     
+    if args.frames > 0:
+        print(f"\nCreating {args.frames}-frame spritesheets...")
+        angles = np.linspace(-135, 135, args.frames)
+        for name, style, color in (
+            ("knob_metallic", "metallic", None),
+            ("knob_neon_cyan", "neon", (0, 229, 255)),
+            ("knob_neon_magenta", "neon", (255, 0, 128)),
+            ("knob_neon_green", "neon", (0, 255, 100)),
+            ("knob_simple", "simple", None),
+            ("knob_cyberpunk", "cyberpunk", None),
+        ):
+            path = samples_dir / f"{name}_frames.png"
+            save_spritesheet(render_frames(style, 256, angles, color), path)
+            print(f"  ✓ Saved: {path} ({256 * args.frames}x256)")
+    
     print(f"\nAll sample knobs saved to: {samples_dir}")
     print("\nYou can load these in the 'Knob animation' tab to test rotation and spritesheet export!")
 
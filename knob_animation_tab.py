@@ -12,8 +12,18 @@ import math
 from pathlib import Path
 from typing import TYPE_CHECKING, List
 
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal
-from PyQt6.QtGui import QPixmap, QPen, QColor, QBrush, QPainter, QTransform, QConicalGradient
+from PyQt6.QtCore import Qt, QRectF, QPointF, QSize, pyqtSignal
+from PyQt6.QtGui import (
+    QPixmap,
+    QPixmapCache,
+    QIcon,
+    QPen,
+    QColor,
+    QBrush,
+    QPainter,
+    QTransform,
+    QConicalGradient,
+)
 from PyQt6.QtWidgets import (
     QFormLayout,
     QGraphicsEllipseItem,
@@ -32,7 +42,6 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QFileDialog,
     QColorDialog,
-    QGraphicsDropShadowEffect,
     QCheckBox,
     QScrollArea,
 )
@@ -44,12 +53,31 @@ from shape_editor_tab import (
     ResizableRectItem,
     ResizableEllipseItem,
     ResizableLineItem,
+    CachedDropShadowEffect,
 )
 
 if TYPE_CHECKING:
     from gui import MainWindow
 
 
+# Swatch icon size, filling the 28x28 color buttons inside their border
+_SWATCH_SIZE = QSize(20, 20)
+# Color buttons show their color as an icon; the style sheet is set once, so
+# color changes don't re-parse CSS and re-polish the button
+_SWATCH_BUTTON_STYLE = "border: 2px solid #555;"
+
+
+def _swatch_icon(color: QColor) -> QIcon:
+    """Color button icon filled with `color`, shared through QPixmapCache."""
+    key = f"knob_swatch/{color.rgba():08x}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(_SWATCH_SIZE)
+        pixmap.fill(color)
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
+
+
 class AngleWheelWidget(QWidget):
     """A small draggable wheel to set an angle by rotating."""
     
@@ -172,6 +200,9 @@ class KnobView(QGraphicsView):
         self._set_center_mode = False  # When True, clicks set rotation center
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)  # Enable keyboard focus
+        # Preview rotation moves the full-size knob pixmap on every slider step,
+        # so tracking the exposed regions per item buys nothing
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
 
     def set_center_mode(self, enabled: bool) -> None:
         """Toggle between shape selection mode and set-center mode."""
@@ -367,7 +398,9 @@ class KnobAnimationTab(QWidget):
         
         self.stroke_color_btn = QPushButton()
         self.stroke_color_btn.setFixedSize(28, 28)
-        self.stroke_color_btn.setStyleSheet(f"background-color: {self.shape_stroke_color.name()}; border: 2px solid #555;")
+        self.stroke_color_btn.setStyleSheet(_SWATCH_BUTTON_STYLE)
+        self.stroke_color_btn.setIconSize(_SWATCH_SIZE)
+        self.stroke_color_btn.setIcon(_swatch_icon(self.shape_stroke_color))
         self.stroke_color_btn.setToolTip("Stroke color")
         self.stroke_color_btn.clicked.connect(self.on_pick_stroke_color)
         colors_layout.addWidget(QLabel("Stroke:"))
@@ -377,7 +410,9 @@ class KnobAnimationTab(QWidget):
         
         self.fill_color_btn = QPushButton()
         self.fill_color_btn.setFixedSize(28, 28)
-        self.fill_color_btn.setStyleSheet("background-color: transparent; border: 2px solid #555;")
+        self.fill_color_btn.setStyleSheet(_SWATCH_BUTTON_STYLE)
+        self.fill_color_btn.setIconSize(_SWATCH_SIZE)
+        self.fill_color_btn.setIcon(_swatch_icon(self.shape_fill_color))
         self.fill_color_btn.setToolTip("Fill color")
         self.fill_color_btn.clicked.connect(self.on_pick_fill_color)
         colors_layout.addWidget(QLabel("Fill:"))
@@ -892,15 +927,18 @@ class KnobAnimationTab(QWidget):
     def _apply_neon_to_shape(self, shape) -> None:
         """Apply or remove neon glow effect from a shape."""
         if self.neon_checkbox.isChecked():
-            effect = QGraphicsDropShadowEffect()
+            effect = CachedDropShadowEffect()
             effect.setBlurRadius(self.neon_radius_spin.value())
             effect.setOffset(0, 0)
             glow_color = QColor(self.shape_stroke_color)
             glow_color.setAlpha(self.neon_intensity_spin.value())
             effect.setColor(glow_color)
             shape.setGraphicsEffect(effect)
+            # Keep the rendered shape as a pixmap; the effect caches the glow
+            shape.setCacheMode(shape.CacheMode.DeviceCoordinateCache)
         else:
             shape.setGraphicsEffect(None)
+            shape.setCacheMode(shape.CacheMode.NoCache)
 
     def on_delete_shape(self) -> None:
         """Delete the currently selected shape."""
@@ -918,10 +956,7 @@ class KnobAnimationTab(QWidget):
             QColorDialog.ColorDialogOption.ShowAlphaChannel
         )
         if color.isValid():
-            self.shape_stroke_color = color
-            self.stroke_color_btn.setStyleSheet(
-                f"background-color: {color.name()}; border: 2px solid #555;"
-            )
+            self.set_stroke_color(color)
             self.on_shape_style_changed()
 
     def on_pick_fill_color(self) -> None:
@@ -931,15 +966,19 @@ class KnobAnimationTab(QWidget):
             QColorDialog.ColorDialogOption.ShowAlphaChannel
         )
         if color.isValid():
-            self.shape_fill_color = color
-            if color.alpha() > 0:
-                self.fill_color_btn.setStyleSheet(
-                    f"background-color: rgba({color.red()},{color.green()},{color.blue()},{color.alpha()}); border: 2px solid #555;"
-                )
-            else:
-                self.fill_color_btn.setStyleSheet("background-color: transparent; border: 2px solid #555;")
+            self.set_fill_color(color)
             self.on_shape_style_changed()
 
+    def set_stroke_color(self, color: QColor) -> None:
+        """Set the stroke color for new shapes and show it on its button."""
+        self.shape_stroke_color = color
+        self.stroke_color_btn.setIcon(_swatch_icon(color))
+
+    def set_fill_color(self, color: QColor) -> None:
+        """Set the fill color for new shapes (alpha 0 for none) and show it."""
+        self.shape_fill_color = color
+        self.fill_color_btn.setIcon(_swatch_icon(color))
+
     def on_shape_style_changed(self) -> None:
         """Update all shapes with current style settings."""
         for shape in self.shapes:
@@ -1,68 +1,48 @@
 import argparse
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import cv2
 import numpy as np
 from PIL import Image
 
 
-def remove_black_background(
-    input_path: Path,
-    output_path: Path,
-    threshold: int = 10,
-) -> None:
+def remove_black_background(rgba: np.ndarray, threshold: int = 10) -> np.ndarray:
     """
-    Remove (near-)black background from an image and save an RGBA PNG.
+    Remove (near-)black background from an RGBA image array.
 
     Anything darker than `threshold` in the grayscale image is treated as
     background and becomes fully transparent. Everything else becomes opaque.
+    Returns a new RGBA array; the input is left untouched.
     """
-    img = cv2.imread(str(input_path), cv2.IMREAD_UNCHANGED)
-    if img is None:
-        raise FileNotFoundError(f"Could not read image: {input_path}")
-
-    # Ensure we have at least 3 channels (BGR). IMREAD_UNCHANGED may already
-    # give us 4 channels, but we construct the alpha ourselves anyway.
-    if img.ndim != 3 or img.shape[2] < 3:
-        raise ValueError("Expected an RGB/RGBA image.")
+    if rgba.ndim != 3 or rgba.shape[2] != 4:
+        raise ValueError("Expected an RGBA image array.")
 
     # Use the color channels to derive a grayscale image.
-    gray = cv2.cvtColor(img[:, :, :3], cv2.COLOR_BGR2GRAY)
+    gray = cv2.cvtColor(rgba, cv2.COLOR_RGBA2GRAY)
 
     # Pixels darker than `threshold` become background (alpha = 0).
     _, mask = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
 
-    # Split out B, G, R channels. Ignore any existing alpha, we are replacing it.
-    b, g, r = cv2.split(img[:, :, :3])
-    rgba = cv2.merge([r, g, b, mask])
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    Image.fromarray(rgba).save(output_path)
+    # Keep the colors, replace any existing alpha with the mask.
+    return np.dstack((rgba[:, :, :3], mask))
 
 
 def split_components(
-    input_path: Path,
-    output_dir: Path,
-    min_area: int = 2000,
-) -> List[Path]:
+    rgba: np.ndarray, min_area: int = 2000
+) -> List[Tuple[Tuple[int, int, int, int], np.ndarray]]:
     """
-    Split an RGBA image into separate components based on the alpha channel.
+    Split an RGBA image array into separate components based on the alpha channel.
 
-    Returns a list of output file paths for the extracted components.
+    Returns one `((x0, y0, x1, y1), crop)` pair per component, where `crop` is
+    the RGBA bounding box of the component with every pixel outside the
+    component made transparent.
     """
-    img = cv2.imread(str(input_path), cv2.IMREAD_UNCHANGED)
-    if img is None:
-        raise FileNotFoundError(f"Could not read image: {input_path}")
-
-    if img.ndim != 3 or img.shape[2] != 4:
+    if rgba.ndim != 3 or rgba.shape[2] != 4:
         raise ValueError("Expected a 4-channel RGBA image for splitting.")
 
-    # Alpha channel indicates where "stuff" exists.
-    b, g, r, a = cv2.split(img)
-
     # Binary mask: alpha > 0 is foreground.
-    _, mask = cv2.threshold(a, 0, 255, cv2.THRESH_BINARY)
+    _, mask = cv2.threshold(rgba[:, :, 3], 0, 255, cv2.THRESH_BINARY)
 
     # Optionally clean up very small specks with morphology.
     kernel = np.ones((3, 3), np.uint8)
@@ -72,26 +52,24 @@ def split_components(
         mask, connectivity=8
     )
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    component_paths: List[Path] = []
-
-    component_index = 1
+    components: List[Tuple[Tuple[int, int, int, int], np.ndarray]] = []
     for label in range(1, num_labels):  # label 0 is background
-        x, y, w, h, area = stats[label]
+        x, y, w, h, area = (int(v) for v in stats[label])
         if area < min_area:
             continue
 
-        crop = img[y : y + h, x : x + w]
-        # Convert BGR(A) (OpenCV) to RGBA (Pillow).
-        crop_rgba = cv2.cvtColor(crop, cv2.COLOR_BGRA2RGBA)
-        comp_img = Image.fromarray(crop_rgba)
+        selected = labels[y : y + h, x : x + w] == label
+        crop = np.zeros((h, w, 4), dtype=np.uint8)
+        crop[selected] = rgba[y : y + h, x : x + w][selected]
+        components.append(((x, y, x + w, y + h), crop))
+
+    return components
 
-        out_path = output_dir / f"component_{component_index}.png"
-        comp_img.save(out_path)
-        component_paths.append(out_path)
-        component_index += 1
 
-    return component_paths
+def load_rgba(path: Path) -> np.ndarray:
+    """Load an image file as an RGBA array."""
+    with Image.open(path) as img:
+        return np.asarray(img.convert("RGBA"))
 
 
 def parse_args() -> argparse.Namespace:
@@ -144,26 +122,21 @@ def main() -> None:
     no_bg_path = output_dir / f"{input_path.stem}_no_bg.png"
 
     print(f"Removing black background from: {input_path}")
-    remove_black_background(
-        input_path=input_path,
-        output_path=no_bg_path,
-        threshold=args.threshold,
-    )
+    no_bg = remove_black_background(load_rgba(input_path), threshold=args.threshold)
+    Image.fromarray(no_bg).save(no_bg_path)
     print(f"Saved background-removed image to: {no_bg_path}")
 
     print("Splitting into components based on alpha channel...")
-    component_paths = split_components(
-        input_path=no_bg_path,
-        output_dir=output_dir,
-        min_area=args.min_area,
-    )
+    components = split_components(no_bg, min_area=args.min_area)
 
-    if not component_paths:
+    if not components:
         print("No components found (check threshold/min-area settings).")
     else:
         print("Saved component images:")
-        for p in component_paths:
-            print(f"  - {p}")
+        for i, (_, crop) in enumerate(components, start=1):
+            out_path = output_dir / f"component_{i}.png"
+            Image.fromarray(crop).save(out_path)
+            print(f"  - {out_path}")
 
 
 if __name__ == "__main__":
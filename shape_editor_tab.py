@@ -8,9 +8,11 @@ Shape Editor Tab - Contains all shape editing functionality including:
 """
 
 import math
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from PyQt6.QtCore import Qt, QRectF, QPointF, QLineF
 from PyQt6.QtGui import (
     QPixmap,
@@ -21,6 +23,7 @@ from PyQt6.QtGui import (
     QBrush,
     QPalette,
     QLinearGradient,
+    QTransform,
     QUndoCommand,
 )
 from PyQt6.QtWidgets import (
@@ -31,6 +34,7 @@ from PyQt6.QtWidgets import (
     QGraphicsScene,
     QGraphicsView,
     QGraphicsDropShadowEffect,
+    QGraphicsEffect,
     QGraphicsRectItem,
     QGraphicsEllipseItem,
     QGroupBox,
@@ -520,6 +524,222 @@ class ShadowDirectionWidget(QWidget):
         super().mousePressEvent(event)
 
 
+# -----------------------------------------------------------------------------
+# Wide Neon Glow Effect
+# -----------------------------------------------------------------------------
+
+
+def _box_blur(values: np.ndarray, radius: int, axis: int) -> np.ndarray:
+    """Mean over a (2 * radius + 1) window along `axis`, zero outside the array."""
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (radius + 1, radius)
+    sums = np.cumsum(np.pad(values, pad), axis=axis)
+    n = values.shape[axis]
+    hi = np.take(sums, np.arange(2 * radius + 1, 2 * radius + 1 + n), axis=axis)
+    lo = np.take(sums, np.arange(n), axis=axis)
+    return (hi - lo) / (2 * radius + 1)
+
+
+class NeonGlowEffect(QGraphicsEffect):
+    """
+    Drop-shadow style glow for large blur radii.
+
+    QGraphicsDropShadowEffect re-blurs the item at full resolution on every
+    paint, which gets expensive for wide glows. This effect blurs a 4x
+    downsampled alpha mask and keeps the tinted result until the item's
+    pixels, the radius, the color or the offset change. It mirrors the
+    color/blurRadius/offset API of QGraphicsDropShadowEffect.
+    """
+
+    DOWNSAMPLE = 4
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._color = QColor(63, 63, 63, 180)
+        self._blur_radius = 1.0
+        self._offset = QPointF(8, 8)
+        self._glow: QPixmap | None = None
+        self._glow_key: tuple | None = None
+
+    def color(self) -> QColor:
+        return QColor(self._color)
+
+    def setColor(self, color: QColor) -> None:
+        if color != self._color:
+            self._color = QColor(color)
+            self.update()
+
+    def blurRadius(self) -> float:
+        return self._blur_radius
+
+    def setBlurRadius(self, radius: float) -> None:
+        if radius != self._blur_radius:
+            self._blur_radius = float(radius)
+            self.updateBoundingRect()
+
+    def offset(self) -> QPointF:
+        return QPointF(self._offset)
+
+    def setOffset(self, dx: float, dy: float) -> None:
+        offset = QPointF(dx, dy)
+        if offset != self._offset:
+            self._offset = offset
+            self.updateBoundingRect()
+
+    def boundingRectFor(self, rect: QRectF) -> QRectF:
+        r = self._blur_radius
+        glow = rect.translated(self._offset).adjusted(-r, -r, r, r)
+        return rect.united(glow)
+
+    def sourceChanged(self, flags) -> None:
+        # The item repainted or changed shape, so its pixels may differ
+        self._glow_key = None
+
+    def draw(self, painter: QPainter) -> None:
+        pixmap, offset = self.sourcePixmap(
+            Qt.CoordinateSystem.DeviceCoordinates,
+            QGraphicsEffect.PixmapPadMode.PadToEffectiveBoundingRect,
+        )
+        if pixmap.isNull():
+            return
+
+        # Scrolling moves the pixmap but not its contents, so the position is
+        # keyed relative to the device translation
+        world = painter.worldTransform()
+        key = (
+            pixmap.width(),
+            pixmap.height(),
+            offset.x() - world.dx(),
+            offset.y() - world.dy(),
+            world.m11(),
+            world.m12(),
+            world.m21(),
+            world.m22(),
+            self._blur_radius,
+            self._color.rgba(),
+            self._offset.x(),
+            self._offset.y(),
+        )
+        if key != self._glow_key:
+            self._glow = self._render_glow(pixmap)
+            self._glow_key = key
+
+        # The glow offset is in item coordinates, so it scales and rotates
+        # with the view like the rest of the item
+        glow_offset = world.map(self._offset) - world.map(QPointF(0, 0))
+        painter.setWorldTransform(QTransform())
+        painter.drawPixmap(QPointF(offset) + glow_offset, self._glow)
+        painter.drawPixmap(offset, pixmap)
+        painter.setWorldTransform(world)
+
+    def _render_glow(self, pixmap: QPixmap) -> QPixmap:
+        """Blur the pixmap's alpha at reduced size and tint it with the glow color."""
+        w, h = pixmap.width(), pixmap.height()
+        small_w = max(1, w // self.DOWNSAMPLE)
+        small_h = max(1, h // self.DOWNSAMPLE)
+        mask = (
+            pixmap.toImage()
+            .scaled(
+                small_w,
+                small_h,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            .convertToFormat(QImage.Format.Format_Alpha8)
+        )
+        ptr = mask.constBits()
+        ptr.setsize(mask.sizeInBytes())
+        alpha = np.frombuffer(ptr, dtype=np.uint8).reshape(small_h, mask.bytesPerLine())
+        alpha = alpha[:, :small_w].astype(np.float32)
+
+        # Three box passes per axis approximate a Gaussian; a sigma of about a
+        # quarter of the blur radius matches QGraphicsDropShadowEffect's falloff
+        box = max(1, round(self._blur_radius / (4 * self.DOWNSAMPLE)))
+        for axis in (0, 1):
+            for _ in range(3):
+                alpha = _box_blur(alpha, box, axis)
+
+        alpha *= self._color.alphaF()
+        glow = np.empty((small_h, small_w, 4), dtype=np.uint8)
+        for c, value in enumerate(
+            (self._color.red(), self._color.green(), self._color.blue())
+        ):
+            glow[:, :, c] = alpha * (value / 255.0) + 0.5
+        glow[:, :, 3] = alpha + 0.5
+
+        image = QImage(
+            glow.data, small_w, small_h, 4 * small_w,
+            QImage.Format.Format_RGBA8888_Premultiplied,
+        )
+        return QPixmap.fromImage(image).scaled(
+            w,
+            h,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+
+class CachedDropShadowEffect(QGraphicsDropShadowEffect):
+    """
+    QGraphicsDropShadowEffect that keeps its rendered output between paints.
+
+    The stock effect re-blurs on every paint, including each frame of a drag.
+    Qt keeps the item's source pixmap while the item only moves, so the
+    shadowed result is cached against that pixmap and redrawn as a blit.
+    Only on-screen painting is cached; renders into images (exports) use
+    the stock path.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._output: QPixmap | None = None
+        self._output_key: tuple | None = None
+
+    def draw(self, painter: QPainter) -> None:
+        if not isinstance(painter.device(), QWidget) or (
+            self.blurRadius() <= 0 and self.offset().isNull()
+        ):
+            # Exports render straight to their image so the output is
+            # unchanged, and without a blur there is nothing to keep
+            super().draw(painter)
+            return
+
+        pixmap, offset = self.sourcePixmap(
+            Qt.CoordinateSystem.DeviceCoordinates,
+            QGraphicsEffect.PixmapPadMode.PadToEffectiveBoundingRect,
+        )
+        if pixmap.isNull():
+            return
+
+        # The blur can spill slightly past the padded source pixmap
+        margin = math.ceil(self.blurRadius()) + 1
+        key = (
+            pixmap.cacheKey(),
+            self.blurRadius(),
+            self.color().rgba(),
+            self.xOffset(),
+            self.yOffset(),
+        )
+        if key != self._output_key:
+            output = QPixmap(pixmap.width() + 2 * margin, pixmap.height() + 2 * margin)
+            output.fill(Qt.GlobalColor.transparent)
+            out_painter = QPainter(output)
+            # The base class draws at `offset` with an identity world
+            # transform; the window maps that spot onto the margin
+            out_painter.setWindow(
+                offset.x() - margin, offset.y() - margin, output.width(), output.height()
+            )
+            super().draw(out_painter)
+            out_painter.end()
+            self._output = output
+            self._output_key = key
+
+        world = painter.worldTransform()
+        painter.setWorldTransform(QTransform())
+        painter.drawPixmap(QPointF(offset) - QPointF(margin, margin), self._output)
+        painter.setWorldTransform(world)
+
+
 # -----------------------------------------------------------------------------
 # Drag-to-change SpinBox
 # -----------------------------------------------------------------------------
@@ -947,6 +1167,10 @@ class LayerListWidget(QListWidget):
 class ShapeTransformCommand(QUndoCommand):
     """Undoable command for moving/resizing a single shape."""
 
+    # Transforms of the same shape closer together than this (in seconds)
+    # collapse into one undo step
+    MERGE_WINDOW = 0.5
+
     def __init__(self, item, old_pos: QPointF, new_pos: QPointF, old_rect, new_rect):
         super().__init__("Transform shape")
         self.item = item
@@ -954,6 +1178,22 @@ class ShapeTransformCommand(QUndoCommand):
         self.new_pos = new_pos
         self.old_rect = old_rect
         self.new_rect = new_rect
+        self.timestamp = time.monotonic()
+
+    def id(self) -> int:
+        return 1
+
+    def mergeWith(self, other: QUndoCommand) -> bool:
+        if (
+            not isinstance(other, ShapeTransformCommand)
+            or other.item is not self.item
+            or other.timestamp - self.timestamp > self.MERGE_WINDOW
+        ):
+            return False
+        self.new_pos = other.new_pos
+        self.new_rect = other.new_rect
+        self.timestamp = other.timestamp
+        return True
 
     def undo(self) -> None:
         self.item.setPos(self.old_pos)
@@ -999,9 +1239,16 @@ class ShapeView(QGraphicsView):
                 item_pos = self._owner.shape_base_item.mapFromScene(scene_pos)
                 x = int(item_pos.x())
                 y = int(item_pos.y())
-                img = self._owner.shape_base_image
-                if img is not None and 0 <= x < img.width() and 0 <= y < img.height():
-                    color = QColor(img.pixel(x, y))
+                pixels = self._owner.shape_base_np
+                if pixels is not None and 0 <= x < pixels.shape[1] and 0 <= y < pixels.shape[0]:
+                    # Undo the premultiplication of the 0xAARRGGBB pixel
+                    argb = int(pixels[y, x])
+                    alpha = argb >> 24
+                    r, g, b = (
+                        ((argb >> shift & 0xFF) * 255 + alpha // 2) // alpha if alpha else 0
+                        for shift in (16, 8, 0)
+                    )
+                    color = QColor(r, g, b)
                     if self._owner.color_pick_mode == "stroke":
                         self._owner.shape_stroke_color = color
                     else:
@@ -1044,6 +1291,8 @@ class ShapeView(QGraphicsView):
         ):
             cmd = ShapeTransformCommand(item, self._press_pos, new_pos, self._press_geom, new_geom)
             self._owner.undo_stack.push(cmd)
+            # Covers the other selected items dragged along with this one
+            self._owner._mark_shape_scene_changed()
 
         self._press_item = None
         self._press_pos = None
@@ -1081,6 +1330,7 @@ class ShapeView(QGraphicsView):
 
             for item in self._owner.shape_scene.selectedItems():
                 item.moveBy(dx, dy)
+            self._owner._mark_shape_scene_changed()
 
             event.accept()
             return